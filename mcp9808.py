@@ -1,4 +1,7 @@
+import micropython
+from array import array
 from machine import SoftI2C, I2C
+from time import sleep_ms
 
 HYST_00 = 0b00  # Hysteresis 0°C (power-up default)
 HYST_15 = 0b01  # Hysteresis 1,5°C
@@ -11,6 +14,48 @@ RES_0_125 = 0b10  # Resolution 0.125°C
 RES_0_0625 = 0b11  # Resolution 0.0625°C
 
 
+@micropython.native
+def _pack_cfg(
+    hyst: int,
+    shdn: int,
+    crit_lock: int,
+    window_lock: int,
+    irq_clear_bit: int,
+    alert_ctrl: int,
+    alert_sel: int,
+    alert_pol: int,
+    alert_mode: int,
+) -> int:
+    # Pack the config register fields into a 16 bit word, highest byte first. Bit 4 (alert status) is read only
+    return (
+        (((hyst << 1) | shdn) << 8)
+        | (crit_lock << 7)
+        | (window_lock << 6)
+        | (irq_clear_bit << 5)
+        | (alert_ctrl << 3)
+        | (alert_sel << 2)
+        | (alert_pol << 1)
+        | alert_mode
+    )
+
+
+@micropython.viper
+def _pack_limit(q: int) -> int:
+    # Pack a limit in quarter degrees (signed, 0.25°C sensitivity) into the 16 bit limit register format:
+    # bit 12 sign, bits 11-4 integral, bits 3-2 fractional. Masking the 2's complement value keeps the sign bit
+    return (q << 2) & 0x1FFC
+
+
+@micropython.viper
+def _decode_temp(b0: int, b1: int) -> int:
+    # Combine the 4 lower bits of the first byte and the second byte into the 12 bit magnitude (integral + 4 bit fractional)
+    v = ((b0 & 0x0F) << 8) | b1
+    # Sign extend from bit 12: when the sign bit is set it's worth -4096 (-256°C) in 2's complement
+    v -= (b0 & 0x10) << 8
+    # Temperature in 1/16°C units
+    return v
+
+
 class MCP9808(object):
     BASE_ADDR = 0x18
 
@@ -33,8 +78,17 @@ class MCP9808(object):
         A2: bool = False,
         debug: bool = False,
     ) -> None:
-        self.__i2c: SoftI2C | I2C = i2c
+        # Cache the bound I2C methods used on the hot path, saves two attribute lookups per access
+        self.__read_mem_into = i2c.readfrom_mem_into
+        self.__write_mem = i2c.writeto_mem
         self.__debug_bit: bool = debug
+        # Preallocated receive buffer and views, avoid heap allocation on every register read
+        self.__rxbuf: bytearray = bytearray(2)
+        self.__rxmv: memoryview = memoryview(self.__rxbuf)
+        self.__rxmv1: memoryview = self.__rxmv[:1]
+        # Preallocated transmit buffers for 2 byte (config, limits) and 1 byte (resolution) registers
+        self.__txbuf2: bytearray = bytearray(2)
+        self.__txbuf1: bytearray = bytearray(1)
         if addr:
             self.__addr = addr
         else:
@@ -42,24 +96,28 @@ class MCP9808(object):
         self.__check_device()
         self.__get_config()
 
-    def __debug(self, text: str) -> None:
-        if self.__debug == True:
-            print(text)
+    def __read_reg(self, register: int, n: int = 2) -> bytearray:
+        # Read n (1 or 2) bytes from register into the preallocated receive buffer.
+        # readfrom_mem_into sends the register pointer and reads back with a repeated start, all in one transaction
+        self.__read_mem_into(
+            self.__addr, register, self.__rxmv1 if n == 1 else self.__rxmv
+        )
+        return self.__rxbuf
 
     def __check_device(self) -> None:
-        self.__mfr_id: bytes = self.__i2c.readfrom_mem(self.__addr, self.REG_MFR, 2)
-        if self.__mfr_id != b"\x00\x54":
-            raise Exception(f"Invalid manufacturer ID {self.__mfr_id}")
-        self.__dev_id: bytes = self.__i2c.readfrom_mem(self.__addr, self.REG_DEV, 2)
-        if self.__dev_id[0] != 4:
-            raise Exception(f"Invalid device ID {self.__dev_id[0]}")
-        if self.__dev_id[1] != 0:
-            self.__debug(
-                f"[WARN] Module written for HW revision 0 but got {self.__dev_id[1]}.",
+        buf: bytearray = self.__read_reg(self.REG_MFR)
+        if buf[0] != 0x00 or buf[1] != 0x54:
+            raise Exception(f"Invalid manufacturer ID {bytes(buf)}")
+        self.__read_reg(self.REG_DEV)
+        if buf[0] != 4:
+            raise Exception(f"Invalid device ID {buf[0]}")
+        if self.__debug_bit and buf[1] != 0:
+            print(
+                f"[WARN] Module written for HW revision 0 but got {buf[1]}.",
             )
 
     def __get_config(self) -> None:
-        buf: bytes = self.__i2c.readfrom_mem(self.__addr, self.REG_CFG, 2)
+        buf: bytearray = self.__read_reg(self.REG_CFG)
         self.hyst_mode: int = (buf[0] >> 1) & 0x03
         self.shdn = bool(buf[0] & 0x01)
         self.crit_lock = bool((buf[1] >> 7) & 0x01)
@@ -71,6 +129,48 @@ class MCP9808(object):
         self.alert_pol = bool((buf[1] >> 1) & 0x01)
         self.alert_mode = bool(buf[1] & 0x01)
 
+    def __check_config(
+        self,
+        hyst_mode: int,
+        shdn: bool,
+        crit_lock: bool,
+        window_lock: bool,
+        irq_clear_bit: bool,
+        alert_ctrl: bool,
+        alert_sel: bool,
+        alert_pol: bool,
+        alert_mode: bool,
+    ) -> None:
+        if hyst_mode.__class__ is not int or not 0 <= hyst_mode <= 3:
+            raise ValueError(
+                f"Invalid hysteresis mode: {hyst_mode}. Value should be between 0 and 3 inclusive."
+            )
+        # Check all the flags in one go, only look for the offending one when something is wrong
+        if (
+            shdn.__class__ is not bool
+            or crit_lock.__class__ is not bool
+            or window_lock.__class__ is not bool
+            or irq_clear_bit.__class__ is not bool
+            or alert_ctrl.__class__ is not bool
+            or alert_sel.__class__ is not bool
+            or alert_pol.__class__ is not bool
+            or alert_mode.__class__ is not bool
+        ):
+            for name, value in (
+                ("shutdown", shdn),
+                ("crit lock", crit_lock),
+                ("temperature window lock", window_lock),
+                ("interrupt clear", irq_clear_bit),
+                ("alert output control", alert_ctrl),
+                ("alert output select", alert_sel),
+                ("alert output polarity", alert_pol),
+                ("alert output mode", alert_mode),
+            ):
+                if value.__class__ is not bool:
+                    raise TypeError(
+                        f"Invalid {name} argument type: {value} {value.__class__}. Expecting a bool.",
+                    )
+
     def __set_config(
         self,
         hyst_mode: int | None = None,
@@ -100,146 +200,160 @@ class MCP9808(object):
         if alert_mode is None:
             alert_mode = self.alert_mode
 
-        if hyst_mode not in [HYST_00, HYST_15, HYST_30, HYST_60]:
-            raise ValueError(
-                f"Invalid hysteresis mode: {hyst_mode}. Value should be between 0 and 3 inclusive."
-            )
-        if shdn.__class__ != bool:
-            raise TypeError(
-                f"Invalid shutdown argument type: {shdn} {shdn.__class__}. Expecting a bool.",
-            )
-        if crit_lock.__class__ != bool:
-            raise TypeError(
-                f"Invalid crit lock argument type: {crit_lock} {crit_lock.__class__}. Expecting a bool.",
-            )
-        if window_lock.__class__ != bool:
-            raise TypeError(
-                f"Invalid temperature window lock argument type: {window_lock} {window_lock.__class__}. Expecting a bool.",
-            )
-        if irq_clear_bit.__class__ != bool:
-            raise TypeError(
-                f"Invalid interrupt clear argument type: {irq_clear_bit} {irq_clear_bit.__class__}. Expecting a bool.",
-            )
-        if alert_ctrl.__class__ != bool:
-            raise TypeError(
-                f"Invalid alert output control argument type: {alert_ctrl} {alert_ctrl.__class__}. Expecting a bool.",
-            )
-        if alert_sel.__class__ != bool:
-            raise TypeError(
-                f"Invalid alert output select argument type: {alert_sel} {alert_sel.__class__}. Expecting a bool.",
-            )
-        if alert_pol.__class__ != bool:
-            raise TypeError(
-                f"Invalid alert output polarity argument type: {alert_pol} {alert_pol.__class__}. Expecting a bool.",
-            )
-        if alert_mode.__class__ != bool:
-            raise TypeError(
-                f"Invalid alert output mode argument type: {alert_mode} {alert_mode.__class__}. Expecting a bool.",
-            )
-
-        buf = bytearray(b"\x00\x00")
-        buf[0] = (hyst_mode << 1) | shdn
-        buf[1] = (
-            (crit_lock << 7)
-            | (window_lock << 6)
-            | (irq_clear_bit << 5)
-            | (alert_ctrl << 3)
-            | (alert_sel << 2)
-            | (alert_pol << 1)
-            | alert_mode
+        self.__check_config(
+            hyst_mode,
+            shdn,
+            crit_lock,
+            window_lock,
+            irq_clear_bit,
+            alert_ctrl,
+            alert_sel,
+            alert_pol,
+            alert_mode,
         )
-        self.__i2c.writeto_mem(self.__addr, self.REG_CFG, buf)
-        self.__get_config()
-        if self.hyst_mode != hyst_mode:
-            self.__debug(
-                f"[WARN] Tried to set hysteresis mode but failed. Set {hyst_mode} but get {self.hyst_mode}.",
-            )
-        if self.shdn != shdn:
-            self.__debug(
-                f"[WARN] Tried to set shutdown but failed. Set {shdn} but get {self.shdn}.",
-            )
-        if self.crit_lock != crit_lock:
-            self.__debug(
-                f"[WARN] Tried to set crit lock but failed. Set {crit_lock} but get {self.crit_lock}.",
-            )
-        if self.irq_clear_bit == True:
-            self.__debug(
-                "[WARN] Something wrong with interrupt clear bit. Read True should always be False"
-            )
-        if self.window_lock != window_lock:
-            self.__debug(
-                f"[WARN] Tried to set window lock but failed. Set {window_lock} but get {self.window_lock}.",
-            )
-        if self.alert_ctrl != alert_ctrl:
-            self.__debug(
-                f"[WARN] Tried to set alert output control but failed. Set {alert_ctrl} but get {self.alert_ctrl}.",
-            )
-        if self.alert_sel != alert_sel:
-            self.__debug(
-                f"[WARN] Tried to set alert output select but failed. Set {alert_sel} but get {self.alert_sel}.",
-            )
-        if self.alert_pol != alert_pol:
-            self.__debug(
-                f"[WARN] Tried to set alert output polarity but failed. Set {alert_pol} but get {self.alert_pol}.",
-            )
-        if self.alert_mode != alert_mode:
-            self.__debug(
-                f"[WARN] Tried to set alert output mode but failed. Set {alert_mode} but get {self.alert_mode}.",
-            )
-
-    def __set_alert_limit(self, limit: float | int, register: int) -> None:
 
-        if not limit.__class__ in [float, int]:
+        buf: bytearray = self.__txbuf2
+        packed: int = _pack_cfg(
+            hyst_mode,
+            shdn,
+            crit_lock,
+            window_lock,
+            irq_clear_bit,
+            alert_ctrl,
+            alert_sel,
+            alert_pol,
+            alert_mode,
+        )
+        buf[0] = packed >> 8
+        buf[1] = packed & 0xFF
+        self.__write_mem(self.__addr, self.REG_CFG, buf)
+        # With a lock bit set the sensor silently ignores writes to some fields, read back the actual state.
+        # Otherwise the sensor holds exactly what was written, update the cached fields without another read
+        if self.__debug_bit or self.crit_lock or self.window_lock:
+            self.__get_config()
+        else:
+            self.hyst_mode = hyst_mode
+            self.shdn = shdn
+            self.crit_lock = crit_lock
+            self.window_lock = window_lock
+            # Interrupt clear bit always reads back 0
+            self.irq_clear_bit = False
+            self.alert_ctrl = alert_ctrl
+            self.alert_sel = alert_sel
+            self.alert_pol = alert_pol
+            self.alert_mode = alert_mode
+        if self.__debug_bit:
+            # Compare the written word with the read back one in one go, only look at each field if something differs.
+            # Interrupt clear (bit 5) always reads back 0 and alert status (bit 4) is read only
+            diff: int = ((self.__rxbuf[0] << 8) | self.__rxbuf[1]) ^ (packed & 0xFFDF)
+            if diff & 0x07EF:
+                if self.hyst_mode != hyst_mode:
+                    print(
+                        f"[WARN] Tried to set hysteresis mode but failed. Set {hyst_mode} but get {self.hyst_mode}.",
+                    )
+                if self.shdn != shdn:
+                    print(
+                        f"[WARN] Tried to set shutdown but failed. Set {shdn} but get {self.shdn}.",
+                    )
+                if self.crit_lock != crit_lock:
+                    print(
+                        f"[WARN] Tried to set crit lock but failed. Set {crit_lock} but get {self.crit_lock}.",
+                    )
+                if self.irq_clear_bit == True:
+                    print(
+                        "[WARN] Something wrong with interrupt clear bit. Read True should always be False"
+                    )
+                if self.window_lock != window_lock:
+                    print(
+                        f"[WARN] Tried to set window lock but failed. Set {window_lock} but get {self.window_lock}.",
+                    )
+                if self.alert_ctrl != alert_ctrl:
+                    print(
+                        f"[WARN] Tried to set alert output control but failed. Set {alert_ctrl} but get {self.alert_ctrl}.",
+                    )
+                if self.alert_sel != alert_sel:
+                    print(
+                        f"[WARN] Tried to set alert output select but failed. Set {alert_sel} but get {self.alert_sel}.",
+                    )
+                if self.alert_pol != alert_pol:
+                    print(
+                        f"[WARN] Tried to set alert output polarity but failed. Set {alert_pol} but get {self.alert_pol}.",
+                    )
+                if self.alert_mode != alert_mode:
+                    print(
+                        f"[WARN] Tried to set alert output mode but failed. Set {alert_mode} but get {self.alert_mode}.",
+                    )
+
+    def __limit_to_quarters(self, limit: float | int) -> int:
+        if limit.__class__ is not float and limit.__class__ is not int:
             raise TypeError(
                 f"Invalid temperature alert type, expecting float or int but got {limit.__class__}.",
             )
-        if limit < -128 or limit > 127:
+        # Check the range before converting, so inf, nan and huge floats get a ValueError instead of an OverflowError
+        if not -128.125 < limit < 127.125:
             raise ValueError("Temperature out of range [-128, 127]")
-        if limit < -20 or limit > 100:
-            self.__debug(
+        # Convert the limit to quarter degrees (the register sensitivity), everything below is integer arithmetic.
+        # The limit is rounded to the nearest quarter degree, halves to even (10.2 -> 10.25, 10.125 -> 10.0, 10.375 -> 10.5)
+        q: int = int(round(limit * 4))
+        if self.__debug_bit and (q < -80 or q > 400):
+            print(
                 "[WARN] Temperature outside of operational range, limit won't be ever reached.",
             )
+        return q
 
-        buf = bytearray(b"\x00\x00")
+    def __write_alert_limit(self, q: int, register: int) -> None:
+        buf: bytearray = self.__txbuf2
+        packed: int = _pack_limit(q)
+        buf[0] = packed >> 8
+        buf[1] = packed & 0xFF
 
-        # If limit is negative set sign fifth bit on otherwise leave it at 0
-        if limit < 0:
-            sign = 0x10
-        else:
-            sign = 0x00
-
-        # If limit is between -1 and 0 (like -0.25) set integral to 0xFF (-0 in 2's complement)
-        if -1 < limit < 0:
-            integral: int = 0xFF
-        # Otherwise truncate limit to a int and keep only the rightmost byte
-        else:
-            integral: int = int(limit) & 0xFF
+        self.__write_mem(self.__addr, register, buf)
 
-        # Calculate the fractional part by keeping the 2 rightmost bits of the integer division of 0.25 (the sensitivity) and the remainder part of the decimal part of limit
-        frac_normal = int((limit - integral) / 0.25) & 0x03
+        # Read back only to verify the write, skip the transaction entirely when not debugging
+        if self.__debug_bit:
+            check: bytearray = self.__read_reg(register)
+            if check != buf:
+                print(
+                    f"[WARN] Tried to set alert limit temperature but failed. Set {buf[0]:08b}-{buf[1]:08b} but got {check[0]:08b}-{check[1]:08b}",
+                )
 
-        # Build the send buffer highest byte combining (bitwise or) sign and the integral right shifted by 4
-        buf[0] = sign | (integral >> 4)
-        # Build the send buffer lowest byte combining (bitwise or) the integral left shifted by 4 and the fractional part left shifted by 2 (last 2 bit are 0)
-        buf[1] = (integral << 4) | (frac_normal << 2)
-
-        self.__i2c.writeto_mem(self.__addr, register, buf)
-
-        check: bytes = self.__i2c.readfrom_mem(self.__addr, register, 2)
+    def __set_alert_limit(self, limit: float | int, register: int) -> None:
+        self.__write_alert_limit(self.__limit_to_quarters(limit), register)
 
-        if check != buf:
-            self.__debug(
-                f"[WARN] Tried to set alert limit temperature but failed. Set {buf[0]:08b}-{buf[1]:08b} but got {check[0]:08b}-{check[1]:08b}",
+    def __set_config_msb(self, hyst_mode: int, shdn: bool) -> None:
+        # Hysteresis and shutdown are the only fields in the config register highest byte, write just that byte
+        if hyst_mode.__class__ is not int or not 0 <= hyst_mode <= 3:
+            raise ValueError(
+                f"Invalid hysteresis mode: {hyst_mode}. Value should be between 0 and 3 inclusive."
             )
+        buf: bytearray = self.__txbuf1
+        buf[0] = (hyst_mode << 1) | shdn
+        self.__write_mem(self.__addr, self.REG_CFG, buf)
+        # With a lock bit set the sensor may ignore the shutdown bit, read back the actual state.
+        # When debugging read it back too, to verify the 1 byte write itself
+        if self.__debug_bit or self.crit_lock or self.window_lock:
+            self.__get_config()
+            if self.__debug_bit:
+                if self.hyst_mode != hyst_mode:
+                    print(
+                        f"[WARN] Tried to set hysteresis mode but failed. Set {hyst_mode} but get {self.hyst_mode}.",
+                    )
+                if self.shdn != shdn:
+                    print(
+                        f"[WARN] Tried to set shutdown but failed. Set {shdn} but get {self.shdn}.",
+                    )
+        else:
+            self.hyst_mode = hyst_mode
+            self.shdn = shdn
 
     def set_hysteresis_mode(
         self,
         hyst_mode: int,
     ) -> None:
-        self.__set_config(hyst_mode=hyst_mode)
+        self.__set_config_msb(hyst_mode, self.shdn)
 
     def shutdown(self, wake=False) -> None:
-        self.__set_config(shdn=not wake)
+        self.__set_config_msb(self.hyst_mode, not wake)
 
     def lock_crit_limit(self, unlock=False) -> None:
         self.__set_config(crit_lock=not unlock)
@@ -251,7 +365,8 @@ class MCP9808(object):
         self.__set_config(irq_clear_bit=True)
 
     def get_alert_status(self) -> bool:
-        self.__get_config()
+        # Only the alert status bit can change on its own, read the config register and extract just that
+        self.alert = bool(self.__read_reg(self.REG_CFG)[1] & 0x10)
         return self.alert
 
     def enable_alert(self, disable=False) -> None:
@@ -275,23 +390,11 @@ class MCP9808(object):
     def set_alert_crit_limit(self, crit_limit: float | int) -> None:
         self.__set_alert_limit(crit_limit, self.REG_ATC)
 
-    def get_temeperature(self) -> float:
-        # Read temperature register from sensor
-        buf: bytes = self.__i2c.readfrom_mem(self.__addr, self.REG_TEM, 2)
-        # Extract the sign bit
-        sign: int = buf[0] & 0x10
-        # Calculate the 4 upper bit of the integral by left shifting the first byte by 4 and keeping the rightmost byte of the first buf byte
-        upper: int = (buf[0] << 4) & 0xFF
-        # Calculate the 4 lower bit of the integral and the fractional part into a float by dividing by 16 the rightmost byte of the second buf byte
-        lower: float = (buf[1] & 0xFF) / 16
-        # Calculate the temperature as a float by adding the upper byte (leftmost 4 bit of integral) and the lower byte (rightmost 4 bit of integral + fractional).
-        # In case of negative value subtract 256 from the sum to convert from 2's complement 8+4bit fractional value to negative float
-        temp: float = (upper + lower) - 256 if sign else upper + lower
-        return temp
+    def __decode_temp(self, buf: bytearray) -> float:
+        # Scale from 1/16°C units to °C
+        return _decode_temp(buf[0], buf[1]) * 0.0625
 
-    def get_alert_triggers(self) -> tuple[bool, bool, bool]:
-        # Read temperature register from sensor
-        buf: bytes = self.__i2c.readfrom_mem(self.__addr, self.REG_TEM, 2)
+    def __decode_alerts(self, buf: bytearray) -> tuple[bool, bool, bool]:
         # Extract the 16th bit (last), Ta vs. Tcrit. False = Ta < Tcrit | True = Ta >= Tcrit
         ta_tcrit = bool(buf[0] & 0x80)
         # Extract the 15th bit, Ta vs. Tupper. False = Ta <= Tupper | True = Ta > Tupper
@@ -301,19 +404,137 @@ class MCP9808(object):
 
         return ta_tcrit, ta_tupper, ta_tlower
 
-    def set_resolution(self, resolution=RES_0_0625) -> None:
+    def get_temeperature(self) -> float:
+        return self.__decode_temp(self.__read_reg(self.REG_TEM))
+
+    def get_alert_triggers(self) -> tuple[bool, bool, bool]:
+        return self.__decode_alerts(self.__read_reg(self.REG_TEM))
+
+    def read_temperature_and_alerts(self) -> tuple[float, bool, bool, bool]:
+        # Temperature and alert trigger bits live in the same register, decode both from a single read
+        buf: bytearray = self.__read_reg(self.REG_TEM)
+        ta_tcrit, ta_tupper, ta_tlower = self.__decode_alerts(buf)
+        return self.__decode_temp(buf), ta_tcrit, ta_tupper, ta_tlower
+
+    @micropython.native
+    def get_temperatures_bulk(self, out: array, period_ms: int = 0) -> None:
+        # Fill a preallocated array (typecode "f") with len(out) temperature samples, period_ms apart.
+        # Reads inline to avoid per sample method calls and allocations
+        read_mem_into = self.__read_mem_into
+        addr: int = self.__addr
+        reg: int = self.REG_TEM
+        rxbuf: bytearray = self.__rxbuf
+        rxmv: memoryview = self.__rxmv
+        for i in range(len(out)):
+            if i and period_ms:
+                sleep_ms(period_ms)
+            read_mem_into(addr, reg, rxmv)
+            out[i] = _decode_temp(rxbuf[0], rxbuf[1]) * 0.0625
+
+    def __check_resolution(self, resolution: int) -> None:
         # Check if resolution is a compatible value
-        if not resolution in [RES_0_5, RES_0_25, RES_0_125, RES_0_0625]:
+        if resolution.__class__ is not int or not 0 <= resolution <= 3:
             raise ValueError(
                 f"Invalid resolution: {resolution}. Value should be between 0 and 3 inclusive.",
             )
 
-        buf = bytearray(b"\x00")
+    def set_resolution(self, resolution=RES_0_0625) -> None:
+        self.__check_resolution(resolution)
+
+        buf: bytearray = self.__txbuf1
+        buf[0] = resolution & 0x03
+        self.__write_mem(self.__addr, self.REG_RES, buf)
+        if self.__debug_bit:
+            check: bytearray = self.__read_reg(self.REG_RES, 1)
+            if check[0] != buf[0]:
+                print(
+                    f"[WARN] Tried to set resolution but failed. Set {resolution} but got {check[0]}",
+                )
+
+    def configure(
+        self,
+        hyst_mode: int | None = None,
+        shdn: bool | None = None,
+        crit_lock: bool | None = None,
+        window_lock: bool | None = None,
+        alert_ctrl: bool | None = None,
+        alert_sel: bool | None = None,
+        alert_pol: bool | None = None,
+        alert_mode: bool | None = None,
+        upper_limit: float | int | None = None,
+        lower_limit: float | int | None = None,
+        crit_limit: float | int | None = None,
+        resolution: int | None = None,
+    ) -> None:
+        # Check every argument before writing anything, an invalid call must not leave a half applied setup
+        upper_q: int | None = None
+        lower_q: int | None = None
+        crit_q: int | None = None
+        if upper_limit is not None:
+            upper_q = self.__limit_to_quarters(upper_limit)
+        if lower_limit is not None:
+            lower_q = self.__limit_to_quarters(lower_limit)
+        if crit_limit is not None:
+            crit_q = self.__limit_to_quarters(crit_limit)
+        if resolution is not None:
+            self.__check_resolution(resolution)
+        set_config: bool = (
+            hyst_mode is not None
+            or shdn is not None
+            or crit_lock is not None
+            or window_lock is not None
+            or alert_ctrl is not None
+            or alert_sel is not None
+            or alert_pol is not None
+            or alert_mode is not None
+        )
+        if set_config:
+            if hyst_mode is None:
+                hyst_mode = self.hyst_mode
+            if shdn is None:
+                shdn = self.shdn
+            if crit_lock is None:
+                crit_lock = self.crit_lock
+            if window_lock is None:
+                window_lock = self.window_lock
+            if alert_ctrl is None:
+                alert_ctrl = self.alert_ctrl
+            if alert_sel is None:
+                alert_sel = self.alert_sel
+            if alert_pol is None:
+                alert_pol = self.alert_pol
+            if alert_mode is None:
+                alert_mode = self.alert_mode
+            self.__check_config(
+                hyst_mode,
+                shdn,
+                crit_lock,
+                window_lock,
+                False,
+                alert_ctrl,
+                alert_sel,
+                alert_pol,
+                alert_mode,
+            )
 
-        buf[0] |= resolution & 0x03
-        self.__i2c.writeto_mem(self.__addr, self.REG_RES, buf)
-        check = self.__i2c.readfrom_mem(self.__addr, self.REG_RES, 1)
-        if check != buf:
-            self.__debug(
-                f"[WARN] Tried to set resolution but failed. Set {resolution} but got {check[0]}",
+        # Write the limits first, once a lock bit is set the matching limit registers can't be written anymore
+        if upper_q is not None:
+            self.__write_alert_limit(upper_q, self.REG_ATU)
+        if lower_q is not None:
+            self.__write_alert_limit(lower_q, self.REG_ATL)
+        if crit_q is not None:
+            self.__write_alert_limit(crit_q, self.REG_ATC)
+        if resolution is not None:
+            self.set_resolution(resolution)
+        # Apply all the config register fields with a single write instead of one per setter
+        if set_config:
+            self.__set_config(
+                hyst_mode=hyst_mode,
+                shdn=shdn,
+                crit_lock=crit_lock,
+                window_lock=window_lock,
+                alert_ctrl=alert_ctrl,
+                alert_sel=alert_sel,
+                alert_pol=alert_pol,
+                alert_mode=alert_mode,
             )
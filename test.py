@@ -1,4 +1,5 @@
 import unittest
+from array import array
 import mcp9808
 from mcp9808 import MCP9808
 from machine import SoftI2C, Pin
@@ -17,8 +18,13 @@ class TestMCP9808(unittest.TestCase):
         sleep_ms(20)
         self.power.on()
 
+    def device(self) -> MCP9808:
+        # Fresh instance, its fields come from reading the sensor instead of the setters cache
+        return MCP9808(self.i2c)
+
     def test_powerup_defaults(self) -> None:
         self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_00)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_00)
         self.assertFalse(self.sensor.shdn)
         self.assertFalse(self.sensor.crit_lock)
         self.assertFalse(self.sensor.window_lock)
@@ -32,18 +38,37 @@ class TestMCP9808(unittest.TestCase):
     def test_hysteresis_set(self) -> None:
         self.sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_15)
         self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_15)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_15)
         self.sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_30)
         self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_30)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_30)
         self.sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_60)
         self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_60)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_60)
         self.sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_00)
         self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_00)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_00)
 
     def test_shutdown(self) -> None:
         self.sensor.shutdown()
         self.assertTrue(self.sensor.shdn)
+        self.assertTrue(self.device().shdn)
         self.sensor.shutdown(wake=True)
         self.assertFalse(self.sensor.shdn)
+        self.assertFalse(self.device().shdn)
+
+    def test_config_msb_write(self) -> None:
+        for debug in (False, True):
+            sensor = MCP9808(self.i2c, debug=debug)
+            sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_30)
+            self.assertEqual(self.device().hyst_mode, mcp9808.HYST_30)
+            sensor.shutdown()
+            self.assertTrue(self.device().shdn)
+            sensor.shutdown(wake=True)
+            self.assertFalse(self.device().shdn)
+            self.assertEqual(self.device().hyst_mode, mcp9808.HYST_30)
+            sensor.set_hysteresis_mode(hyst_mode=mcp9808.HYST_00)
+            self.assertEqual(self.device().hyst_mode, mcp9808.HYST_00)
 
     def test_crit_lock(self) -> None:
         self.sensor.lock_crit_limit()
@@ -66,6 +91,61 @@ class TestMCP9808(unittest.TestCase):
     def test_interrupt(self) -> None:
         self.sensor.irq_clear()
 
+    def test_read_temperature_and_alerts(self) -> None:
+        temp, ta_tcrit, ta_tupper, ta_tlower = self.sensor.read_temperature_and_alerts()
+        self.assertAlmostEqual(temp, self.sensor.get_temeperature(), delta=0.5)
+        self.assertEqual(
+            (ta_tcrit, ta_tupper, ta_tlower), self.sensor.get_alert_triggers()
+        )
+
+    def read_limit_reg(self, register: int) -> bytes:
+        return self.i2c.readfrom_mem(MCP9808.BASE_ADDR, register, 2)
+
+    def test_alert_limit_encoding(self) -> None:
+        for limit, expected in (
+            (30, b"\x01\xe0"),
+            (-0.25, b"\x1f\xfc"),
+            (-1.25, b"\x1f\xec"),
+            (-20.5, b"\x1e\xb8"),
+            (10.2, b"\x00\xa4"),
+            (10.125, b"\x00\xa0"),
+            (10.375, b"\x00\xa8"),
+        ):
+            self.sensor.set_alert_upper_limit(limit)
+            self.assertEqual(self.read_limit_reg(MCP9808.REG_ATU), expected)
+
+    def test_temperatures_bulk(self) -> None:
+        samples = array("f", [0.0] * 4)
+        self.sensor.get_temperatures_bulk(samples)
+        for sample in samples:
+            self.assertAlmostEqual(sample, self.sensor.get_temeperature(), delta=0.5)
+
+    def test_configure(self) -> None:
+        self.sensor.configure(
+            hyst_mode=mcp9808.HYST_30,
+            alert_ctrl=True,
+            alert_pol=True,
+            upper_limit=30,
+            lower_limit=10.5,
+            crit_limit=40.25,
+        )
+        self.assertEqual(self.sensor.hyst_mode, mcp9808.HYST_30)
+        self.assertEqual(self.device().hyst_mode, mcp9808.HYST_30)
+        self.assertTrue(self.sensor.alert_ctrl)
+        self.assertTrue(self.sensor.alert_pol)
+        self.assertFalse(self.sensor.alert_sel)
+        self.assertFalse(self.sensor.alert_mode)
+        device = self.device()
+        self.assertEqual(device.hyst_mode, mcp9808.HYST_30)
+        self.assertTrue(device.alert_ctrl)
+        self.assertTrue(device.alert_pol)
+        self.assertFalse(device.alert_sel)
+        self.assertFalse(device.alert_mode)
+        self.assertEqual(self.read_limit_reg(MCP9808.REG_ATU), b"\x01\xe0")
+        self.assertEqual(self.read_limit_reg(MCP9808.REG_ATL), b"\x00\xa8")
+        self.assertEqual(self.read_limit_reg(MCP9808.REG_ATC), b"\x02\x84")
+        self.sensor_reset()
+
 
 if __name__ == "__main__":
     unittest.main()